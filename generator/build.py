@@ -1,155 +1,211 @@
 #!/usr/bin/env python3
 """Static site generator for El Catecismo Bautista con Beddome."""
 
+import heapq
 import json
+import os
 import re
 import shutil
-from collections import Counter
-from datetime import datetime
+import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import cache
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
+# Static asset directories copied to the output directory
+STATIC_DIRS = ("css", "js", "images")
 
 # Spanish stopwords for term frequency analysis
-SPANISH_STOPWORDS = {
-    "el",
-    "la",
-    "los",
-    "las",
-    "un",
-    "una",
-    "unos",
-    "unas",
-    "de",
-    "del",
-    "al",
-    "a",
-    "en",
-    "con",
-    "por",
-    "para",
-    "que",
-    "es",
-    "son",
-    "se",
-    "su",
-    "sus",
-    "y",
-    "o",
-    "e",
-    "u",
-    "no",
-    "si",
-    "como",
-    "pero",
-    "mas",
-    "este",
-    "esta",
-    "estos",
-    "estas",
-    "ese",
-    "esa",
-    "esos",
-    "esas",
-    "aquel",
-    "aquella",
-    "lo",
-    "le",
-    "les",
-    "me",
-    "te",
-    "nos",
-    "os",
-    "mi",
-    "tu",
-    "ser",
-    "estar",
-    "haber",
-    "tener",
-    "hacer",
-    "poder",
-    "deber",
-    "hay",
-    "quien",
-    "cual",
-    "donde",
-    "cuando",
-    "porque",
-    "sin",
-    "sobre",
-    "entre",
-    "hasta",
-    "desde",
-    "ya",
-    "muy",
-    "bien",
-    "mal",
-    "todo",
-    "toda",
-    "todos",
-    "todas",
-    "otro",
-    "otra",
-    "otros",
-    "otras",
-    "mismo",
-    "misma",
-    "mismos",
-    "mismas",
-    "tal",
-    "tanto",
-    "tanta",
-    "tantos",
-    "tantas",
-    "asi",
-    "pues",
-    "luego",
-    "aunque",
-    "sino",
-    "tambien",
-    "ademas",
-    "ni",
-    "oh",
-    "ellos",
-    "ellas",
-    "ello",
-    "ella",
-    "nosotros",
-    "vosotros",
-    "ustedes",
-    "ha",
-    "han",
-    "he",
-    "sido",
-    "fue",
-    "fueron",
-    "era",
-    "eran",
-    "seria",
-    "seran",
-    "siendo",
-    "puede",
-    "pueden",
-    "debe",
-    "deben",
-    "tiene",
-    "tienen",
-    "hace",
-    "hacen",
-    "esto",
-    "eso",
-    "dios",
-    "cuales",
-    "cada",
-    "segun",
-    "nuestro",
-    "nuestra",
-    "nuestros",
-    "nuestras",
+SPANISH_STOPWORDS = frozenset(
+    {
+        "el",
+        "la",
+        "los",
+        "las",
+        "un",
+        "una",
+        "unos",
+        "unas",
+        "de",
+        "del",
+        "al",
+        "a",
+        "en",
+        "con",
+        "por",
+        "para",
+        "que",
+        "es",
+        "son",
+        "se",
+        "su",
+        "sus",
+        "y",
+        "o",
+        "e",
+        "u",
+        "no",
+        "si",
+        "como",
+        "pero",
+        "mas",
+        "este",
+        "esta",
+        "estos",
+        "estas",
+        "ese",
+        "esa",
+        "esos",
+        "esas",
+        "aquel",
+        "aquella",
+        "lo",
+        "le",
+        "les",
+        "me",
+        "te",
+        "nos",
+        "os",
+        "mi",
+        "tu",
+        "ser",
+        "estar",
+        "haber",
+        "tener",
+        "hacer",
+        "poder",
+        "deber",
+        "hay",
+        "quien",
+        "cual",
+        "donde",
+        "cuando",
+        "porque",
+        "sin",
+        "sobre",
+        "entre",
+        "hasta",
+        "desde",
+        "ya",
+        "muy",
+        "bien",
+        "mal",
+        "todo",
+        "toda",
+        "todos",
+        "todas",
+        "otro",
+        "otra",
+        "otros",
+        "otras",
+        "mismo",
+        "misma",
+        "mismos",
+        "mismas",
+        "tal",
+        "tanto",
+        "tanta",
+        "tantos",
+        "tantas",
+        "asi",
+        "pues",
+        "luego",
+        "aunque",
+        "sino",
+        "tambien",
+        "ademas",
+        "ni",
+        "oh",
+        "ellos",
+        "ellas",
+        "ello",
+        "ella",
+        "nosotros",
+        "vosotros",
+        "ustedes",
+        "ha",
+        "han",
+        "he",
+        "sido",
+        "fue",
+        "fueron",
+        "era",
+        "eran",
+        "seria",
+        "seran",
+        "siendo",
+        "puede",
+        "pueden",
+        "debe",
+        "deben",
+        "tiene",
+        "tienen",
+        "hace",
+        "hacen",
+        "esto",
+        "eso",
+        "dios",
+        "cuales",
+        "cada",
+        "segun",
+        "nuestro",
+        "nuestra",
+        "nuestros",
+        "nuestras",
+    }
+)
+
+# Stopwords as they appear in the lowercased text, accented forms included, so
+# most stopwords can be dropped before normalize_text is called
+_STOPWORDS_RAW = SPANISH_STOPWORDS | {
+    "más",
+    "sí",
+    "tú",
+    "mí",
+    "él",
+    "éste",
+    "ésta",
+    "éstos",
+    "éstas",
+    "ése",
+    "ésa",
+    "ésos",
+    "ésas",
+    "aquél",
+    "quién",
+    "cuál",
+    "cuáles",
+    "dónde",
+    "cuándo",
+    "porqué",
+    "así",
+    "también",
+    "además",
+    "según",
+    "sería",
+    "serán",
+    "está",
 }
 
+# Words with 4+ characters considered for term frequency analysis
+_WORD_RE = re.compile(r"[a-záéíóúñüA-ZÁÉÍÓÚÑÜ]{4,}")
+
+# Book name at the start of a reference, like "1 Juan 3:16" or "Salmos 23:1"
+_REFERENCE_BOOK_RE = re.compile(r"^(\d?\s*[A-Za-záéíóúÁÉÍÓÚñÑ]+)")
+
+# Leading book number, optionally followed by whitespace, as in _REFERENCE_BOOK_RE
+_BOOK_NUMBER_RE = re.compile(r"^(\d)\s*")
+
 # Bible books categorization
-OLD_TESTAMENT_BOOKS = [
+OLD_TESTAMENT_BOOKS = (
     "genesis",
     "exodo",
     "levitico",
@@ -190,9 +246,9 @@ OLD_TESTAMENT_BOOKS = [
     "hageo",
     "zacarias",
     "malaquias",
-]
+)
 
-NEW_TESTAMENT_BOOKS = [
+NEW_TESTAMENT_BOOKS = (
     "mateo",
     "marcos",
     "lucas",
@@ -220,89 +276,127 @@ NEW_TESTAMENT_BOOKS = [
     "3 juan",
     "judas",
     "apocalipsis",
-]
+)
+
+
+def _book_prefix(book: str) -> str:
+    """Return the prefix used to match abbreviated or variant book names."""
+    return book.split()[0] if " " in book else book[:4]
+
+
+# Lookup tables for categorize_book; Old Testament prefixes take precedence
+_BOOK_NAMES: dict[str, str] = {}
+_BOOK_PREFIXES: dict[str, str] = {}
+for _testament, _books in (
+    ("old_testament", OLD_TESTAMENT_BOOKS),
+    ("new_testament", NEW_TESTAMENT_BOOKS),
+):
+    for _book in _books:
+        _BOOK_NAMES[_book] = _testament
+        _BOOK_PREFIXES.setdefault(_book_prefix(_book), _testament)
 
 
 def load_catechism_data(data_path: Path) -> dict:
     """Load and return the catechism JSON data."""
+    if orjson is not None:
+        return orjson.loads(data_path.read_bytes())
+
     with open(data_path, encoding="utf-8") as f:
         return json.load(f)
 
 
-def build_search_index(data: dict) -> list[dict]:
-    """Build a search index from the catechism data."""
-    index = []
-
-    for q in data["questions"]:
-        # Add main question and answer
-        index.append(
-            {
-                "number": q["number"],
-                "type": "question",
-                "question": q["question"],
-                "answer": q["full_answer"],
-                "url": f"/pregunta/{q['number']}.html",
-            }
-        )
-
-        # Add Beddome subquestions
-        for group_idx, group in enumerate(q.get("beddome_expansion", [])):
-            for item in group.get("items", []):
-                index.append(
-                    {
-                        "number": q["number"],
-                        "type": "beddome",
-                        "question": item.get("question", ""),
-                        "answer": item.get("answer", ""),
-                        "verse": item.get("verse", ""),
-                        "reference": item.get("reference", ""),
-                        "url": f"/pregunta/{q['number']}.html#grupo-{group_idx + 1}",
-                    }
-                )
+def write_json(path: Path, data, indent: bool = False) -> None:
+    """Write data as UTF-8 JSON, using orjson when it is available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
 
-    return index
+    path.write_text(
+        json.dumps(data, ensure_ascii=False, indent=2 if indent else None),
+        encoding="utf-8",
+    )
 
 
 def setup_jinja_env(templates_path: Path) -> Environment:
     """Set up and return Jinja2 environment."""
-    env = Environment(loader=FileSystemLoader(templates_path), autoescape=True)
+    # Persist compiled templates between builds in Jinja's per-user cache dir
+    env = Environment(
+        loader=FileSystemLoader(templates_path),
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
     return env
 
 
+def _remove_path(path: Path) -> None:
+    """Remove a file or directory tree."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _sync_dir(src: Path, dst: Path) -> None:
+    """Mirror src into dst, copying only files whose size or mtime changed."""
+    if dst.exists() and not dst.is_dir():
+        _remove_path(dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    src_names = set()
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            src_names.add(entry.name)
+            target = dst / entry.name
+            if entry.is_dir():
+                _sync_dir(Path(entry.path), target)
+                continue
+
+            # A directory in place of a source file must go before copying
+            if target.is_dir():
+                _remove_path(target)
+
+            src_stat = entry.stat()
+            try:
+                dst_stat = target.stat()
+            except FileNotFoundError:
+                dst_stat = None
+            if (
+                dst_stat is None
+                or dst_stat.st_mtime_ns != src_stat.st_mtime_ns
+                or dst_stat.st_size != src_stat.st_size
+            ):
+                shutil.copy2(entry.path, target)
+
+    # Remove files no longer present in the source
+    for item in dst.iterdir():
+        if item.name not in src_names:
+            _remove_path(item)
+
+
 def copy_static_files(static_path: Path, output_path: Path) -> None:
     """Copy static files (CSS, JS, images) to output directory."""
-    static_output = output_path
-
-    # Copy CSS
-    css_src = static_path / "css"
-    css_dst = static_output / "css"
-    if css_src.exists():
-        if css_dst.exists():
-            shutil.rmtree(css_dst)
-        shutil.copytree(css_src, css_dst)
-
-    # Copy JS
-    js_src = static_path / "js"
-    js_dst = static_output / "js"
-    if js_src.exists():
-        if js_dst.exists():
-            shutil.rmtree(js_dst)
-        shutil.copytree(js_src, js_dst)
-
-    # Copy images
-    images_src = static_path / "images"
-    images_dst = static_output / "images"
-    if images_src.exists():
-        if images_dst.exists():
-            shutil.rmtree(images_dst)
-        shutil.copytree(images_src, images_dst)
+    for name in STATIC_DIRS:
+        src = static_path / name
+        dst = output_path / name
+        if src.exists():
+            _sync_dir(src, dst)
+        elif dst.exists() or dst.is_symlink():
+            # Drop output left over from a static directory that was removed
+            _remove_path(dst)
 
 
 def generate_sitemap(
-    data: dict, output_path: Path, base_url: str = "https://catecismobautista.org"
+    env: Environment,
+    data: dict,
+    output_path: Path,
+    base_url: str = "https://catecismobautista.org",
 ) -> None:
     """Generate sitemap.xml for SEO."""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()
 
     urls = []
 
@@ -347,20 +441,9 @@ def generate_sitemap(
             }
         )
 
-    # Generate XML
-    xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    for url in urls:
-        xml_content += "  <url>\n"
-        xml_content += f"    <loc>{url['loc']}</loc>\n"
-        xml_content += f"    <lastmod>{url['lastmod']}</lastmod>\n"
-        xml_content += f"    <changefreq>{url['changefreq']}</changefreq>\n"
-        xml_content += f"    <priority>{url['priority']}</priority>\n"
-        xml_content += "  </url>\n"
-    xml_content += "</urlset>\n"
-
-    with open(output_path / "sitemap.xml", "w", encoding="utf-8") as f:
-        f.write(xml_content)
+    # Stream the XML straight to disk
+    template = env.get_template("sitemap.xml")
+    template.stream(urls=urls).dump(str(output_path / "sitemap.xml"), encoding="utf-8")
 
 
 def generate_robots_txt(
@@ -372,52 +455,60 @@ Allow: /
 
 Sitemap: {base_url}/sitemap.xml
 """
-    with open(output_path / "robots.txt", "w", encoding="utf-8") as f:
-        f.write(content)
+    (output_path / "robots.txt").write_text(content, encoding="utf-8")
 
 
+@cache
 def normalize_text(text: str) -> str:
     """Normalize text by removing accents and converting to lowercase."""
-    import unicodedata
-
-    normalized = unicodedata.normalize("NFD", text.lower())
+    lowered = text.lower()
+    # Quick checks: plain ASCII or already-decomposed text without marks
+    # needs no further work
+    if lowered.isascii():
+        return lowered
+    if unicodedata.is_normalized("NFD", lowered) and not any(
+        unicodedata.category(c) == "Mn" for c in lowered
+    ):
+        return lowered
+
+    normalized = unicodedata.normalize("NFD", lowered)
     return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
 
 
+@cache
 def extract_book_name(reference: str) -> str | None:
     """Extract the book name from a Bible reference."""
     if not reference:
         return None
-    # Match patterns like "1 Juan 3:16" or "Salmos 23:1"
-    match = re.match(r"^(\d?\s*[A-Za-záéíóúÁÉÍÓÚñÑ]+)", reference.strip())
+    match = _REFERENCE_BOOK_RE.match(reference.strip())
     if match:
         return match.group(1).strip()
     return None
 
 
+@cache
 def categorize_book(book_name: str) -> str | None:
     """Categorize a book as Old or New Testament."""
     if not book_name:
         return None
-    normalized = normalize_text(book_name)
-
-    for ot_book in OLD_TESTAMENT_BOOKS:
-        if normalized == ot_book or normalized.startswith(
-            ot_book.split()[0] if " " in ot_book else ot_book[:4]
-        ):
-            return "old_testament"
-
-    for nt_book in NEW_TESTAMENT_BOOKS:
-        if normalized == nt_book or normalized.startswith(
-            nt_book.split()[0] if " " in nt_book else nt_book[:4]
-        ):
-            return "new_testament"
-
-    return None
+    # Separate a leading book number the way references allow ("1Juan")
+    normalized = _BOOK_NUMBER_RE.sub(r"\1 ", normalize_text(book_name))
+
+    testament = _BOOK_NAMES.get(normalized)
+    if testament is None:
+        testament = _BOOK_PREFIXES.get(_book_prefix(normalized))
+    if testament is None:
+        # Short or unusual spellings may only start with a known prefix
+        testament = next(
+            (t for p, t in _BOOK_PREFIXES.items() if normalized.startswith(p)),
+            None,
+        )
+    return testament
 
 
-def build_statistics(data: dict) -> dict:
-    """Build comprehensive statistics from the catechism data."""
+def build_index_and_stats(data: dict) -> tuple[list[dict], dict]:
+    """Build the search index and statistics in a single pass over the data."""
+    index = []
     stats = {
         "summary": {},
         "top_references": [],
@@ -426,16 +517,15 @@ def build_statistics(data: dict) -> dict:
         "word_cloud_data": [],
         "book_coverage": {"old_testament": {}, "new_testament": {}},
         "question_complexity": [],
-        "scripture_concordance": {},
+        "scripture_concordance": defaultdict(list),
     }
 
-    # Counters
-    reference_counter = Counter()
+    # Counters; references and books are collected and counted in bulk
     term_counter = Counter()
-    book_counter = Counter()
+    all_refs: list[str] = []
+    all_books: list[str] = []
 
     total_subquestions = 0
-    total_references = 0
 
     questions_subq_counts = []
     questions_complexity = []
@@ -444,37 +534,61 @@ def build_statistics(data: dict) -> dict:
         q_subq_count = 0
         q_ref_count = 0
 
+        # Add main question and answer to the search index
+        index.append(
+            {
+                "number": q["number"],
+                "type": "question",
+                "question": q["question"],
+                "answer": q["full_answer"],
+                "url": f"/pregunta/{q['number']}.html",
+            }
+        )
+
         # Collect text for term frequency
         texts = [q["question"], q["full_answer"]]
 
-        for group in q.get("beddome_expansion", []):
+        for group_idx, group in enumerate(q.get("beddome_expansion", [])):
             for item in group.get("items", []):
                 q_subq_count += 1
                 total_subquestions += 1
 
+                subquestion = item.get("question", "")
+                answer = item.get("answer", "")
+                ref = item.get("reference", "")
+
+                # Add Beddome subquestion to the search index
+                index.append(
+                    {
+                        "number": q["number"],
+                        "type": "beddome",
+                        "question": subquestion,
+                        "answer": answer,
+                        "verse": item.get("verse", ""),
+                        "reference": ref,
+                        "url": f"/pregunta/{q['number']}.html#grupo-{group_idx + 1}",
+                    }
+                )
+
                 # Add to texts
-                texts.append(item.get("question", ""))
-                texts.append(item.get("answer", ""))
+                texts.append(subquestion)
+                texts.append(answer)
 
                 # Process reference
-                ref = item.get("reference", "")
                 if ref:
                     q_ref_count += 1
-                    total_references += 1
-                    reference_counter[ref] += 1
+                    all_refs.append(ref)
 
                     # Extract book name for coverage
                     book_name = extract_book_name(ref)
                     if book_name:
-                        book_counter[book_name] += 1
+                        all_books.append(book_name)
 
                     # Build concordance
-                    if ref not in stats["scripture_concordance"]:
-                        stats["scripture_concordance"][ref] = []
                     stats["scripture_concordance"][ref].append(
                         {
                             "question": q["number"],
-                            "subquestion": item.get("question", "")[:80],
+                            "subquestion": subquestion[:80],
                         }
                     )
 
@@ -496,15 +610,18 @@ def build_statistics(data: dict) -> dict:
             }
         )
 
-        # Term frequency analysis
-        for text in texts:
-            if text:
-                # Extract words with 4+ characters
-                words = re.findall(r"\b[a-zA-ZáéíóúñÁÉÍÓÚÑüÜ]{4,}\b", text.lower())
-                for word in words:
-                    normalized = normalize_text(word)
-                    if normalized not in SPANISH_STOPWORDS and len(normalized) >= 4:
-                        term_counter[normalized] += 1
+        # Term frequency analysis: one regex pass over all of the question's text
+        blob = "\n".join(filter(None, texts)).lower()
+        words = (w for w in _WORD_RE.findall(blob) if w not in _STOPWORDS_RAW)
+        term_counter.update(
+            word
+            for word in map(normalize_text, words)
+            if word not in SPANISH_STOPWORDS and len(word) >= 4
+        )
+
+    reference_counter = Counter(all_refs)
+    book_counter = Counter(all_books)
+    total_references = len(all_refs)
 
     # Summary
     stats["summary"] = {
@@ -524,21 +641,20 @@ def build_statistics(data: dict) -> dict:
     ]
 
     # Questions ranked by subquestion count
-    stats["questions_by_subquestion_count"] = sorted(
-        questions_subq_counts, key=lambda x: x["subquestion_count"], reverse=True
-    )[:20]
+    stats["questions_by_subquestion_count"] = heapq.nlargest(
+        20, questions_subq_counts, key=lambda x: x["subquestion_count"]
+    )
 
-    # Term frequency (top 50)
+    # Term frequency (top 50) and word cloud data (top 100, scaled for
+    # visualization) share a single most_common() pass
+    top_terms = term_counter.most_common(100)
     stats["term_frequency"] = [
-        {"term": term, "count": count} for term, count in term_counter.most_common(50)
+        {"term": term, "count": count} for term, count in top_terms[:50]
     ]
-
-    # Word cloud data (scaled for visualization)
-    if term_counter:
-        max_count = max(c for _, c in term_counter.most_common(1))
+    if top_terms:
+        max_count = top_terms[0][1]
         stats["word_cloud_data"] = [
-            [term, int((count / max_count) * 100) + 10]
-            for term, count in term_counter.most_common(100)
+            [term, int((count / max_count) * 100) + 10] for term, count in top_terms
         ]
 
     # Book coverage
@@ -550,21 +666,41 @@ def build_statistics(data: dict) -> dict:
             stats["book_coverage"]["new_testament"][book] = count
 
     # Question complexity ranking
-    stats["question_complexity"] = sorted(
-        questions_complexity, key=lambda x: x["complexity_score"], reverse=True
-    )[:20]
+    stats["question_complexity"] = heapq.nlargest(
+        20, questions_complexity, key=lambda x: x["complexity_score"]
+    )
+
+    return index, stats
+
 
-    return stats
+# Per-process Jinja2 environment used by question page workers
+_worker_env: Environment | None = None
+
+
+def _render_question(args: tuple) -> None:
+    """Render and write a single question page (runs in a worker process)."""
+    global _worker_env
+    q, prev_q, next_q, site_globals, templates_path, questions_dir = args
+
+    # Template objects can't be pickled, so each worker builds its own env once
+    if _worker_env is None:
+        _worker_env = setup_jinja_env(templates_path)
+        _worker_env.globals.update(site_globals)
+
+    question_html = _worker_env.get_template("question.html").render(
+        question=q, prev_question=prev_q, next_question=next_q
+    )
+    (questions_dir / f"{q['number']}.html").write_text(question_html, encoding="utf-8")
 
 
 def build_site(
     data_path: Path, templates_path: Path, static_path: Path, output_path: Path
 ) -> None:
     """Build the complete static site."""
-    # Clean output directory (except .git)
+    # Clean output directory (except .git and static files, which are synced)
     if output_path.exists():
         for item in output_path.iterdir():
-            if item.name not in [".git", "CNAME"]:
+            if item.name not in [".git", "CNAME", *STATIC_DIRS]:
                 if item.is_dir():
                     shutil.rmtree(item)
                 else:
@@ -576,16 +712,21 @@ def build_site(
     print("Loading catechism data...")
     data = load_catechism_data(data_path)
 
-    # Setup Jinja
+    # Setup Jinja; values shared by every page are exposed as globals
     env = setup_jinja_env(templates_path)
+    site_globals = {
+        "title": data["title"],
+        "total_questions": data["total_questions"],
+    }
+    env.globals.update(site_globals)
 
-    # Build search index
-    print("Building search index...")
-    search_index = build_search_index(data)
+    # Build search index and statistics
+    print("Building search index and statistics...")
+    search_index, statistics = build_index_and_stats(data)
     data_output = output_path / "data"
     data_output.mkdir(exist_ok=True)
-    with open(data_output / "search-index.json", "w", encoding="utf-8") as f:
-        json.dump(search_index, f, ensure_ascii=False)
+    write_json(data_output / "search-index.json", search_index)
+    write_json(data_output / "statistics.json", statistics, indent=True)
 
     # Copy static files
     print("Copying static files...")
@@ -595,64 +736,47 @@ def build_site(
     print("Generating homepage...")
     index_template = env.get_template("index.html")
     index_html = index_template.render(
-        title=data["title"],
         description=data["description"],
         questions=data["questions"],
-        total_questions=data["total_questions"],
     )
-    with open(output_path / "index.html", "w", encoding="utf-8") as f:
-        f.write(index_html)
+    (output_path / "index.html").write_text(index_html, encoding="utf-8")
 
     # Generate question pages
     print("Generating question pages...")
-    question_template = env.get_template("question.html")
     questions_dir = output_path / "pregunta"
     questions_dir.mkdir(exist_ok=True)
 
     questions = data["questions"]
-    for i, q in enumerate(questions):
-        prev_q = questions[i - 1] if i > 0 else None
-        next_q = questions[i + 1] if i < len(questions) - 1 else None
-
-        question_html = question_template.render(
-            title=data["title"],
-            question=q,
-            prev_question=prev_q,
-            next_question=next_q,
-            total_questions=data["total_questions"],
+    render_args = (
+        (
+            q,
+            questions[i - 1] if i > 0 else None,
+            questions[i + 1] if i < len(questions) - 1 else None,
+            site_globals,
+            templates_path,
+            questions_dir,
         )
-        with open(questions_dir / f"{q['number']}.html", "w", encoding="utf-8") as f:
-            f.write(question_html)
+        for i, q in enumerate(questions)
+    )
+    with ProcessPoolExecutor() as executor:
+        # Consume the results so worker exceptions are raised here
+        list(executor.map(_render_question, render_args, chunksize=16))
 
     # Generate search page
     print("Generating search page...")
     search_template = env.get_template("search.html")
-    search_html = search_template.render(
-        title=data["title"], total_questions=data["total_questions"]
-    )
-    with open(output_path / "buscar.html", "w", encoding="utf-8") as f:
-        f.write(search_html)
-
-    # Build statistics
-    print("Building statistics...")
-    statistics = build_statistics(data)
-    with open(data_output / "statistics.json", "w", encoding="utf-8") as f:
-        json.dump(statistics, f, ensure_ascii=False, indent=2)
+    search_html = search_template.render()
+    (output_path / "buscar.html").write_text(search_html, encoding="utf-8")
 
     # Generate statistics page
     print("Generating statistics page...")
     stats_template = env.get_template("statistics.html")
-    stats_html = stats_template.render(
-        title=data["title"],
-        total_questions=data["total_questions"],
-        statistics=statistics,
-    )
-    with open(output_path / "estadisticas.html", "w", encoding="utf-8") as f:
-        f.write(stats_html)
+    stats_html = stats_template.render(statistics=statistics)
+    (output_path / "estadisticas.html").write_text(stats_html, encoding="utf-8")
 
     # Generate sitemap and robots.txt
     print("Generating sitemap.xml...")
-    generate_sitemap(data, output_path)
+    generate_sitemap(env, data, output_path)
     print("Generating robots.txt...")
     generate_robots_txt(output_path)
 